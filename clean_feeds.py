@@ -1,31 +1,106 @@
 import os
 import time
+import platform
 from datetime import datetime, timedelta
 import logging
 
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
 FEEDS_DIR = '/opt/rss_collector/rss_feeds'
 DAYS_OLD = 10
 
-def clean_old_files(directory, days_old):
-    now = time.time()
-    cutoff = now - (days_old * 86400)
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        # Logging setup
-        logging.basicConfig(
-            filename='/opt/rss_collector/clean_feeds.log',
-            level=logging.INFO,
-            format='%(asctime)s %(levelname)s:%(message)s'
-        )
-        if os.path.isfile(filepath):
-            file_mtime = os.path.getmtime(filepath)
-            if file_mtime < cutoff:
+# io_uring batching settings
+IO_URING_BATCH_SIZE = 256
+IO_URING_MIN_FILES = 32  # Below this, setting up the ring costs more than it saves
+
+# Logging setup
+logging.basicConfig(
+    filename='/opt/rss_collector/clean_feeds.log',
+    level=logging.INFO,
+    format='%(asctime)s %(levelname)s:%(message)s'
+)
+
+def io_uring_supported():
+    # IORING_OP_UNLINKAT needs Linux 5.11+ and the optional liburing package
+    if liburing is None:
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split('-')[0].split('.')[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 11)
+
+def remove_file(filepath):
+    try:
+        os.remove(filepath)
+        logging.info(f"Deleted: {filepath}")
+    except Exception as e:
+        message = f"Error deleting {filepath}: {e}"
+        logging.error(message)
+
+def remove_files_io_uring(directory, filenames):
+    # Submit unlinks in batches and reap each batch with a single wait.
+    # Returns False without deleting anything if the ring cannot be set up.
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(IO_URING_BATCH_SIZE, ring, 0)
+    except OSError as e:
+        logging.warning(f"io_uring unavailable, falling back to os.remove: {e}")
+        return False
+
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        liburing.io_uring_queue_exit(ring)
+        logging.warning(f"Cannot open {directory} for io_uring, falling back to os.remove: {e}")
+        return False
+
+    try:
+        for start in range(0, len(filenames), IO_URING_BATCH_SIZE):
+            batch = filenames[start:start + IO_URING_BATCH_SIZE]
+            for index, filename in enumerate(batch):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_unlink(sqe, filename, 0, dir_fd)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            liburing.io_uring_submit_and_wait(ring, len(batch))
+
+            liburing.io_uring_wait_cqe(ring, cqe)
+            ready = liburing.io_uring_cq_ready(ring)
+            for i in range(ready):
+                completion = cqe[i]
+                filepath = os.path.join(directory, batch[completion.user_data])
                 try:
-                    os.remove(filepath)
+                    completion.res  # Raises the unlink error, if any
                     logging.info(f"Deleted: {filepath}")
-                except Exception as e:
+                except OSError as e:
                     message = f"Error deleting {filepath}: {e}"
                     logging.error(message)
+            liburing.io_uring_cq_advance(ring, ready)
+    finally:
+        os.close(dir_fd)
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+def clean_old_files(directory, days_old):
+    now = time.time()
+    cutoff = now - (days_old * 86400)
+    stale_files = []
+    # DirEntry caches the file type from the directory read and the stat result after the first lookup
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                stale_files.append(entry.name)
+
+    if len(stale_files) >= IO_URING_MIN_FILES and io_uring_supported():
+        if remove_files_io_uring(directory, stale_files):
+            return
+
+    for filename in stale_files:
+        remove_file(os.path.join(directory, filename))
 
 if __name__ == "__main__":
     clean_old_files(FEEDS_DIR, DAYS_OLD)
\ No newline at end of file
@@ -1,24 +1,86 @@
+import asyncio
+import copy
+import functools
+import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import feedparser
-import json
 import logging
+import multiprocessing
 import time
-from typing import List, Dict, Set
-from urllib.parse import urlparse
-import hashlib
+from collections import defaultdict
+from io import BytesIO
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 from datetime import datetime, timezone
-import requests
-from requests.exceptions import RequestException
+from zoneinfo import ZoneInfo
+import httpx
+from lxml import etree
+import orjson
 import os
+import dateutil.parser
 from dateutil.parser import parse as parse_date
-import pytz
 import backoff
+from pybloom_live import ScalableBloomFilter
 
 # Define constants for paths used across the script
 STATE_FILE = '/opt/rss_collector/collector_state.json'
+SEEN_FILTER_FILE = '/opt/rss_collector/collector_seen.bloom'
 OUTPUT_DIR = '/opt/rss_collector/rss_feeds'
 LOG_FILE = '/opt/rss_collector/rss_collector.log'
 SOURCE_FILE = '/opt/rss_collector/rss_sources.txt'
 
+# Concurrency limits for fetching feeds
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_REQUESTS_PER_HOST = 2
+HOST_POLITENESS_DELAY = 1  # seconds between requests to the same host
+KEEPALIVE_TIMEOUT = 60  # seconds an idle pooled connection is kept open
+
+# Bloom filter sizing for the persistent set of seen entries
+SEEN_FILTER_CAPACITY = 10000
+SEEN_FILTER_ERROR_RATE = 0.001
+
+# Background threads writing feed JSON files while collection continues
+WRITER_THREADS = 2
+
+# Consecutive entries not newer than the last fetch time after which a newest-first feed stops being scanned
+OLD_ENTRY_LIMIT = 3
+
+# Feed item elements (RSS <item>, Atom <entry>) in any namespace
+ITEM_TAGS = ('{*}item', '{*}entry')
+DC_NAMESPACE = 'http://purl.org/dc/elements/1.1/'
+CONTENT_NAMESPACE = 'http://purl.org/rss/1.0/modules/content/'
+XHTML_NAMESPACE = 'http://www.w3.org/1999/xhtml'
+
+# Map item child element names to the entry fields used downstream
+ITEM_FIELDS = {
+    'title': 'title',
+    'pubDate': 'published',
+    'published': 'published',
+    'issued': 'published',
+    'updated': 'updated',
+    'modified': 'updated',
+    'date': 'updated',
+    'description': 'summary',
+    'summary': 'summary'
+}
+
+# Content type assumed for feeds served without one, so feedparser skips encoding detection
+DEFAULT_CONTENT_TYPE = 'application/rss+xml; charset=utf-8'
+
+# Timezone mappings for certain feed date strings, and a reusable date parser
+_TZINFOS = {
+    'CEST': ZoneInfo('Europe/Paris'),
+    'CET': ZoneInfo('Europe/Paris')
+}
+_DATE_PARSER = dateutil.parser.parser()
+
+# Default headers sent with every request made through the shared session
+DEFAULT_HEADERS = {
+    'User-Agent': 'RSSFeedCollector/1.0',
+    'Accept-Encoding': 'gzip, deflate, br'
+}
+
 # Configure logging once at the module level
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +91,216 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; keep only its warnings and errors
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# Only title, link, dates and summary are read from feedparser results, so skip
+# its HTML sanitizing and relative URI resolution passes
+feedparser.SANITIZE_HTML = False
+feedparser.RESOLVE_RELATIVE_URIS = False
+
+
+class FeedNotModified(Exception):
+    """
+    Raised when a feed responds with HTTP 304, meaning it has not changed since the last fetch.
+    """
+
+
+def _markup(elem: etree._Element) -> str:
+    """
+    Serialize an inline markup element without the namespace declarations it inherits from the feed root.
+    """
+    elem = copy.deepcopy(elem)
+    etree.cleanup_namespaces(elem)
+    return etree.tostring(elem, encoding='unicode')
+
+
+def _element_text(elem: etree._Element) -> str:
+    """
+    Return the text of a feed element, serializing inline markup (e.g. Atom type="xhtml") as-is.
+    """
+    if elem.get('type') == 'xhtml' and len(elem) == 1 and elem[0].tag == f'{{{XHTML_NAMESPACE}}}div':
+        # Atom xhtml content is wrapped in a namespaced div; keep only its contents, without namespaces
+        elem = copy.deepcopy(elem[0])
+        for descendant in elem.iter(tag=etree.Element):
+            descendant.tag = etree.QName(descendant).localname
+    if len(elem):
+        return ((elem.text or '') + ''.join(_markup(child) for child in elem)).strip()
+    return (elem.text or '').strip()
+
+
+def _item_fields(item: etree._Element) -> Dict[str, str]:
+    """
+    Extract title, link, published/updated and summary from an RSS item or Atom entry element.
+    """
+    item_namespace = etree.QName(item).namespace
+    fields = {}
+    content = None
+    permalink = None
+    for child in item:
+        if not isinstance(child.tag, str):
+            continue  # Skip comments and processing instructions
+        name = etree.QName(child)
+        if name.namespace == CONTENT_NAMESPACE and name.localname == 'encoded':
+            content = content or _element_text(child)
+            continue
+        if name.namespace not in (item_namespace, DC_NAMESPACE):
+            continue
+        if name.localname == 'link':
+            # Atom links carry the URL in href; only the alternate link points at the article
+            if child.get('href') is None:
+                fields.setdefault('link', (child.text or '').strip())
+            elif child.get('rel', 'alternate') == 'alternate':
+                # Relative hrefs resolve against any xml:base in scope
+                fields.setdefault('link', urljoin(child.base or '', child.get('href')))
+        elif name.localname == 'content':
+            content = content or _element_text(child)
+        elif name.localname == 'guid':
+            # A guid is the item's permalink unless isPermaLink="false"
+            if (child.get('isPermaLink') or 'true').lower() == 'true':
+                permalink = permalink or (child.text or '').strip()
+        elif name.localname in ITEM_FIELDS:
+            fields.setdefault(ITEM_FIELDS[name.localname], _element_text(child))
+    # Like feedparser, fall back to the full content for the summary and the permalink guid for the link
+    if content and not fields.get('summary'):
+        fields['summary'] = content
+    if permalink and not fields.get('link'):
+        fields['link'] = permalink
+    return fields
+
+
+def _iter_feed_items(content: bytes) -> Iterator[Dict[str, str]]:
+    """
+    Stream RSS items or Atom entries from raw feed content with lxml.
+    
+    Each element is cleared once processed so memory stays flat, and callers may
+    stop iterating early without parsing the rest of the document.
+    
+    Args:
+        content (bytes): Raw feed content.
+        
+    Yields:
+        Dict[str, str]: Fields of each feed item.
+        
+    Raises:
+        etree.XMLSyntaxError: If the content is not well-formed XML.
+    """
+    for _, elem in etree.iterparse(BytesIO(content), events=('end',), tag=ITEM_TAGS,
+                                   resolve_entities='internal', no_network=True):
+        yield _item_fields(elem)
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_pub_date(pub_date_str: str) -> datetime:
+    """
+    Parse a feed date string into a naive UTC datetime, caching results for repeated strings.
+    
+    Raises:
+        ValueError: If the string is not a recognizable date.
+    """
+    pub_date = _DATE_PARSER.parse(pub_date_str, tzinfos=_TZINFOS)
+    if pub_date.tzinfo:
+        pub_date = pub_date.astimezone(timezone.utc).replace(tzinfo=None)
+    return pub_date
+
+
+def _build_entries(url: str, source: str, items: Iterable[Dict], last_fetch_time: datetime) -> List[Tuple[str, Dict]]:
+    """
+    Convert feed items into the standardized entry format, keeping only entries
+    newer than the last fetch time.
+    
+    Most feeds list entries newest first, so once OLD_ENTRY_LIMIT consecutive
+    entries older than the last fetch time are seen the rest of the feed is
+    skipped. If an entry is newer than the one before it, the feed is treated as
+    unsorted and scanned in full.
+    
+    Entries without a usable date are stamped with the current time, so each
+    entry is paired with the date string the feed actually gave, which stays
+    stable across runs and is used for deduplication.
+    
+    Args:
+        url (str): RSS feed URL.
+        source (str): Feed host recorded as each entry's source.
+        items (Iterable[Dict]): Feed items exposing title, link, published/updated and summary.
+        last_fetch_time (datetime): Last successful fetch time of the feed.
+        
+    Returns:
+        List[Tuple[str, Dict]]: Raw feed date string and feed entry in standardized format.
+    """
+    entries = []
+    now_utc = datetime.now(timezone.utc)
+    fetched_at = now_utc.isoformat()
+    newest_first = True
+    previous_pub_date = None
+    consecutive_old = 0
+
+    for entry in items:
+        pub_date_str = entry.get('published', entry.get('updated', ''))
+        try:
+            pub_date = _parse_pub_date(pub_date_str) if pub_date_str else now_utc.replace(tzinfo=None)
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid date '{pub_date_str}' in feed {url}; using current time")
+            pub_date = now_utc.replace(tzinfo=None)
+
+        if previous_pub_date is not None and pub_date > previous_pub_date:
+            newest_first = False
+        previous_pub_date = pub_date
+
+        if pub_date <= last_fetch_time:
+            consecutive_old += 1
+            if newest_first and consecutive_old >= OLD_ENTRY_LIMIT:
+                break
+            continue
+        consecutive_old = 0
+
+        entries.append((pub_date_str, {
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'published': pub_date.isoformat(),
+            'summary': entry.get('summary', ''),
+            'source': source,
+            'fetched_at': fetched_at
+        }))
+
+    return entries
+
+
+def _parse_content(url: str, source: str, content: bytes, last_fetch_time: datetime,
+                   content_type: str = DEFAULT_CONTENT_TYPE) -> List[Tuple[str, Dict]]:
+    """
+    Parse raw feed content into standardized entries newer than last fetch time.
+    
+    Feeds are streamed with lxml; content that is not well-formed XML falls back
+    to feedparser, which tolerates broken feeds. This is a module-level function
+    so it can be pickled and run in a worker process.
+    
+    Args:
+        url (str): RSS feed URL.
+        source (str): Feed host recorded as each entry's source.
+        content (bytes): Raw feed content.
+        last_fetch_time (datetime): Last successful fetch time of the feed.
+        content_type (str): Content-Type the feed was served with, passed to feedparser
+            so it can decode the content without guessing the encoding.
+        
+    Returns:
+        List[Tuple[str, Dict]]: Raw feed date string and feed entry in standardized format.
+    """
+    try:
+        return _build_entries(url, source, _iter_feed_items(content), last_fetch_time)
+    except etree.XMLSyntaxError as e:
+        logger.warning(f"Feed at {url} is not well-formed XML ({e}); falling back to feedparser")
+
+    feed = feedparser.parse(content, response_headers={'content-type': content_type})
+    if feed.bozo:
+        logger.warning(f"Feed at {url} has issues: {feed.bozo_exception}")
+        if "syntax error" in str(feed.bozo_exception).lower():
+            logger.error(f"Skipping malformed feed {url}")
+            return []
+
+    return _build_entries(url, source, feed.entries, last_fetch_time)
 
 
 class RSSFeedCollector:
@@ -38,35 +310,56 @@ class RSSFeedCollector:
     Attributes:
         feed_urls (List[str]): List of RSS feed URLs to collect.
         output_dir (str): Directory where JSON feed files will be saved.
-        state_file (str): JSON file path to persist last fetch times for each feed URL.
+        state_file (str): JSON file path to persist last fetch times and cache validators for each feed URL.
         feeds (Dict[str, List[Dict]]): Dictionary storing collected entries per feed URL.
-        seen_hashes (Set[str]): Set of hashes to detect duplicate entries across runs.
+        seen_filter_file (str): File path to persist the Bloom filter of seen entries.
+        seen_filter (ScalableBloomFilter): Bloom filter of seen entry keys to detect duplicates across runs.
         last_fetch_times (Dict[str, datetime]): Last successful fetch timestamps per feed URL.
+        etags (Dict[str, str]): ETag header last returned by each feed URL.
+        last_modified (Dict[str, str]): Last-Modified header last returned by each feed URL.
     """
     
-    def __init__(self, feed_urls: List[str], output_dir: str = OUTPUT_DIR, state_file: str = STATE_FILE):
+    def __init__(self, feed_urls: List[str], output_dir: str = OUTPUT_DIR, state_file: str = STATE_FILE,
+                 seen_filter_file: str = SEEN_FILTER_FILE):
         """
         Initialize RSSFeedCollector instance.
         
         Args:
             feed_urls (List[str]): List of RSS feed URLs.
             output_dir (str): Directory for storing JSON feed files.
-            state_file (str): File path to persist collector state (last fetch times).
+            state_file (str): File path to persist collector state (last fetch times and cache validators).
+            seen_filter_file (str): File path to persist the Bloom filter of seen entries.
         """
         self.feed_urls = feed_urls
         self.output_dir = output_dir
         self.state_file = state_file
+        self.seen_filter_file = seen_filter_file
         self.feeds: Dict[str, List[Dict]] = {url: [] for url in feed_urls}
-        self.seen_hashes: Set[str] = set()
+        self.seen_filter = self.load_seen_filter()
+        self.etags: Dict[str, str] = {}
+        self.last_modified: Dict[str, str] = {}
+        # Set by run() so each feed's JSON file is written as soon as it is parsed
+        self._write_pool: Optional[ThreadPoolExecutor] = None
         self.last_fetch_times = self.load_last_fetch_times()
         
+        # Parse each feed URL's host once. Output file names use the sanitized host plus
+        # a short hash of the URL, so feeds sharing a host never write to the same file
+        self._netlocs = {url: urlparse(url).netloc for url in feed_urls}
+        self._file_prefixes = {
+            url: f"{netloc.replace('.', '_')}_{hashlib.blake2b(url.encode('utf-8'), digest_size=4).hexdigest()}"
+            for url, netloc in self._netlocs.items()
+        }
+        
         # Ensure the output directory exists
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
 
     def load_last_fetch_times(self) -> Dict[str, datetime]:
         """
         Load last fetch timestamps for each feed URL from the state file.
+        Cached ETag and Last-Modified values are loaded into etags and last_modified.
+        
+        State entries written before cache validators were stored are plain
+        timestamp strings and are still accepted.
         
         Returns:
             Dict[str, datetime]: Mapping of feed URL to last fetch datetime.
@@ -74,11 +367,18 @@ class RSSFeedCollector:
         logger.info(f"Loading last fetch times from state file: {self.state_file}")
         try:
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
                 fetch_times = {}
                 for url in self.feed_urls:
-                    timestamp = state.get(url, '1970-01-01T00:00:00Z')
+                    feed_state = state.get(url, {})
+                    if isinstance(feed_state, str):
+                        feed_state = {'ts': feed_state}
+                    timestamp = feed_state.get('ts') or '1970-01-01T00:00:00Z'
+                    if feed_state.get('etag'):
+                        self.etags[url] = feed_state['etag']
+                    if feed_state.get('last_modified'):
+                        self.last_modified[url] = feed_state['last_modified']
                     parsed_time = parse_date(timestamp).replace(tzinfo=None)
                     fetch_times[url] = parsed_time
                     logger.info(f"Last fetch time for {url}: {parsed_time.isoformat()}")
@@ -94,57 +394,109 @@ class RSSFeedCollector:
 
     def save_state(self) -> None:
         """
-        Save the current datetime as the last fetch time for all feed URLs to the state file.
+        Save the current datetime as the last fetch time for all feed URLs to the state file,
+        along with the latest ETag and Last-Modified values returned by each feed.
         """
         try:
-            state = {url: datetime.now(timezone.utc).isoformat() for url in self.feed_urls}
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f)
+            now_iso = datetime.now(timezone.utc).isoformat()
+            state = {
+                url: {
+                    'ts': now_iso,
+                    'etag': self.etags.get(url),
+                    'last_modified': self.last_modified.get(url)
+                }
+                for url in self.feed_urls
+            }
+            with open(self.state_file, 'wb') as f:
+                f.write(orjson.dumps(state))
             logger.info("Collector state saved successfully.")
         except Exception as e:
             logger.error(f"Error saving collector state: {str(e)}")
 
-    def generate_entry_hash(self, entry: Dict) -> str:
+    def load_seen_filter(self) -> ScalableBloomFilter:
         """
-        Generate a unique hash string for an RSS feed entry based on key fields.
+        Load the Bloom filter of previously seen entries from disk.
         
-        Args:
-            entry (Dict): RSS feed entry.
-            
         Returns:
-            str: MD5 hash string representing the entry.
+            ScalableBloomFilter: Persisted filter, or an empty one if none can be loaded.
         """
-        key_fields = (
-            entry.get('title', ''),
-            entry.get('link', ''),
-            entry.get('published', ''),
-            entry.get('summary', '')
-        )
-        return hashlib.md5(''.join(key_fields).encode('utf-8')).hexdigest()
+        logger.info(f"Loading seen entries filter from: {self.seen_filter_file}")
+        try:
+            if os.path.exists(self.seen_filter_file):
+                with open(self.seen_filter_file, 'rb') as f:
+                    return ScalableBloomFilter.fromfile(f)
+            logger.warning(f"Seen entries filter not found. Starting with an empty filter.")
+        except Exception as e:
+            logger.error(f"Error loading seen entries filter: {str(e)}")
+        return ScalableBloomFilter(initial_capacity=SEEN_FILTER_CAPACITY, error_rate=SEEN_FILTER_ERROR_RATE)
+
+    def save_seen_filter(self) -> None:
+        """
+        Save the Bloom filter of seen entries to disk.
+        """
+        try:
+            with open(self.seen_filter_file, 'wb') as f:
+                self.seen_filter.tofile(f)
+            logger.info("Seen entries filter saved successfully.")
+        except Exception as e:
+            logger.error(f"Error saving seen entries filter: {str(e)}")
+
+    def _entry_key(self, entry: Dict, pub_date_str: str) -> str:
+        """
+        Build the deduplication key of an entry from its title, link, raw feed date and summary.
+        The raw date is used because entries without a parseable date are published at the fetch time.
+        """
+        return '\x1f'.join((entry['title'], entry['link'], pub_date_str, entry['summary']))
 
-    @backoff.on_exception(backoff.expo, RequestException, max_tries=3)
-    def fetch_feed(self, url: str) -> bytes:
+    @backoff.on_exception(backoff.expo, httpx.HTTPError, max_tries=3)
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[bytes, str]:
         """
         Fetch RSS feed content from the specified URL with retries on failure.
         
+        A conditional GET is sent using the ETag and Last-Modified values from the
+        previous fetch, and the validators returned by the server are cached for
+        the next run.
+        
         Args:
+            client (httpx.AsyncClient): Shared HTTP client used for the request.
             url (str): URL of the RSS feed.
             
         Returns:
-            bytes: Content of the fetched RSS feed.
+            Tuple[bytes, str]: Content of the fetched RSS feed and its Content-Type.
             
         Raises:
-            RequestException: If the HTTP request fails after retries.
+            FeedNotModified: If the feed has not changed since the last fetch.
+            httpx.HTTPError: If the HTTP request fails or times out after retries.
         """
-        response = requests.get(url, timeout=30, headers={'User-Agent': 'RSSFeedCollector/1.0'})
+        headers = {}
+        if url in self.etags:
+            headers['If-None-Match'] = self.etags[url]
+        if url in self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified[url]
+
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            raise FeedNotModified(url)
         response.raise_for_status()
-        return response.content
 
-    def parse_feed(self, url: str) -> List[Dict]:
+        if response.headers.get('ETag'):
+            self.etags[url] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            self.last_modified[url] = response.headers['Last-Modified']
+        return response.content, response.headers.get('Content-Type', DEFAULT_CONTENT_TYPE)
+
+    async def parse_feed(self, client: httpx.AsyncClient, executor: Executor, url: str) -> List[Dict]:
         """
-        Parse RSS feed content from the given URL and return entries newer than last fetch time.
+        Fetch and parse the RSS feed at the given URL and return entries newer than last fetch time.
+        
+        Feed parsing is offloaded to a worker process so that it runs in parallel with
+        other feeds and overlaps with in-flight network requests. Entries are
+        deduplicated here against the persistent seen filter, once the worker's
+        results are back.
         
         Args:
+            client (httpx.AsyncClient): Shared HTTP client used for the request.
+            executor (Executor): Process pool that parses feed content.
             url (str): RSS feed URL.
             
         Returns:
@@ -152,100 +504,127 @@ class RSSFeedCollector:
         """
         try:
             logger.info(f"Fetching feed from: {url}")
-            content = self.fetch_feed(url)
-            feed = feedparser.parse(content)
-
-            if feed.bozo:
-                logger.warning(f"Feed at {url} has issues: {feed.bozo_exception}")
-                if "syntax error" in str(feed.bozo_exception).lower():
-                    logger.error(f"Skipping malformed feed {url}")
-                    return []
-
-            # Timezone mappings for certain feed date strings
-            tzinfos = {
-                'CEST': pytz.timezone('Europe/Paris'),
-                'CET': pytz.timezone('Europe/Paris')
-            }
-
-            entries = []
+            content, content_type = await self._fetch(client, url)
+            loop = asyncio.get_running_loop()
             last_fetch_time = self.last_fetch_times.get(url, datetime(1970, 1, 1))
+            parsed_entries = await loop.run_in_executor(
+                executor, _parse_content, url, self._netlocs[url], content, last_fetch_time, content_type
+            )
 
-            for entry in feed.entries:
-                pub_date_str = entry.get('published', entry.get('updated', ''))
-                try:
-                    pub_date = parse_date(pub_date_str, tzinfos=tzinfos) if pub_date_str else datetime.now(timezone.utc)
-                    if pub_date.tzinfo:
-                        pub_date = pub_date.astimezone(pytz.UTC).replace(tzinfo=None)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid date '{pub_date_str}' in feed {url}; using current time")
-                    pub_date = datetime.now(timezone.utc).replace(tzinfo=None)
-
-                if pub_date <= last_fetch_time:
+            entries = []
+            for pub_date_str, parsed_entry in parsed_entries:
+                # add() returns True when the key was already in the filter
+                if self.seen_filter.add(self._entry_key(parsed_entry, pub_date_str)):
                     continue
-
-                parsed_entry = {
-                    'title': entry.get('title', ''),
-                    'link': entry.get('link', ''),
-                    'published': pub_date.isoformat(),
-                    'summary': entry.get('summary', ''),
-                    'source': urlparse(url).netloc,
-                    'fetched_at': datetime.now(timezone.utc).isoformat()
-                }
-
-                entry_hash = self.generate_entry_hash(parsed_entry)
-                if entry_hash not in self.seen_hashes:
-                    self.seen_hashes.add(entry_hash)
-                    entries.append(parsed_entry)
+                entries.append(parsed_entry)
 
             logger.info(f"Collected {len(entries)} new entries from {url}")
             return entries
 
-        except RequestException as e:
+        except FeedNotModified:
+            logger.info(f"Feed {url} not modified since last fetch; skipping")
+            return []
+        except httpx.HTTPError as e:
             logger.error(f"Request failed for feed {url}: {str(e)}")
             return []
         except Exception as e:
             logger.error(f"Error parsing feed {url}: {str(e)}")
             return []
 
+    async def _collect_host(self, client: httpx.AsyncClient, executor: Executor, urls: List[str]) -> None:
+        """
+        Collect all feeds served by a single host, limiting concurrent requests and
+        pausing between requests to stay polite to that host.
+        
+        Args:
+            client (httpx.AsyncClient): Shared HTTP client used for the requests.
+            executor (Executor): Process pool that parses feed content.
+            urls (List[str]): Feed URLs belonging to the same host.
+        """
+        semaphore = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+
+        async def collect(url: str) -> None:
+            async with semaphore:
+                self.feeds[url] = await self.parse_feed(client, executor, url)
+                if self._write_pool is not None:
+                    self._write_pool.submit(self._write_one_feed, url, self.feeds[url])
+                await asyncio.sleep(HOST_POLITENESS_DELAY)  # Politeness delay
+
+        await asyncio.gather(*(collect(url) for url in urls))
+
+    async def _collect_async(self) -> None:
+        """
+        Fetch all feeds concurrently, grouped by host, over a single HTTP client.
+        The client negotiates HTTP/2 where servers support it, so concurrent
+        requests to the same host are multiplexed over one TLS connection, and
+        keeps connections alive so later requests skip the handshake.
+        Parsing is spread across a process pool sized to the number of CPUs. Its
+        workers start from a forkserver rather than being forked from this process,
+        whose event loop and background threads they must not inherit.
+        """
+        urls_by_host: Dict[str, List[str]] = defaultdict(list)
+        for url in self.feeds:  # Unique URLs, so no feed is collected and written twice
+            urls_by_host[self._netlocs[url]].append(url)
+
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_TIMEOUT
+        )
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('forkserver')) as executor:
+            async with httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=limits,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True
+            ) as client:
+                await asyncio.gather(*(self._collect_host(client, executor, urls) for urls in urls_by_host.values()))
+
     def collect_all_feeds(self) -> None:
         """
         Collect and parse all RSS feeds listed in feed_urls.
         """
-        for url in self.feed_urls:
-            self.feeds[url] = self.parse_feed(url)
-            time.sleep(1)  # Politeness delay
+        asyncio.run(self._collect_async())
 
         total_entries = sum(len(entries) for entries in self.feeds.values())
         logger.info(f"Total new entries collected: {total_entries}")
 
-    def save_to_json(self) -> None:
+    def _write_one_feed(self, url: str, entries: List[Dict]) -> None:
         """
-        Save collected feed entries for each URL into separate JSON files.
-        Each file is named using the feed domain and current timestamp.
+        Save the collected entries of one feed into a JSON file named using the
+        feed domain, a short hash of the feed URL and the current timestamp.
         Entries are saved as JSON objects separated by commas, without enclosing array brackets.
+        
+        Args:
+            url (str): RSS feed URL.
+            entries (List[Dict]): Entries collected from the feed.
         """
-        for url, entries in self.feeds.items():
-            if not entries:
-                logger.info(f"No new entries to save for feed {url}")
-                continue
+        if not entries:
+            logger.info(f"No new entries to save for feed {url}")
+            return
 
-            try:
-                domain = urlparse(url).netloc.replace('.', '_')
-                timestamp = datetime.now(timezone.utc).strftime('%Y_%m_%d_%H%M')
-                output_file = os.path.join(self.output_dir, f"{domain}_{timestamp}.json")
+        try:
+            domain = self._file_prefixes[url]
+            timestamp = datetime.now(timezone.utc).strftime('%Y_%m_%d_%H%M')
+            output_file = os.path.join(self.output_dir, f"{domain}_{timestamp}.json")
+
+            # Build the whole payload first so each file is written in one call
+            payload = b",\n".join(orjson.dumps(entry) for entry in entries) + b"\n"
+            with open(output_file, 'wb') as f:
+                f.write(payload)
 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    for i, entry in enumerate(entries):
-                        json.dump(entry, f, ensure_ascii=False)
-                        if i < len(entries) - 1:
-                            f.write(",\n")
-                        else:
-                            f.write("\n")
+            logger.info(f"Saved {len(entries)} entries to {output_file}")
 
-                logger.info(f"Saved {len(entries)} entries to {output_file}")
+        except Exception as e:
+            logger.error(f"Failed to save entries to {output_file}: {str(e)}")
 
-            except Exception as e:
-                logger.error(f"Failed to save entries to {output_file}: {str(e)}")
+    def save_to_json(self) -> None:
+        """
+        Save collected feed entries for each URL into separate JSON files.
+        """
+        for url, entries in self.feeds.items():
+            self._write_one_feed(url, entries)
 
     def run(self) -> None:
         """
@@ -254,9 +633,16 @@ class RSSFeedCollector:
         start_time = time.time()
         logger.info("Starting RSS feed collection")
 
-        self.collect_all_feeds()
-        self.save_to_json()
+        # Write each feed's file in the background as soon as it is parsed,
+        # overlapping disk writes with the remaining network fetches
+        self._write_pool = ThreadPoolExecutor(max_workers=WRITER_THREADS)
+        try:
+            self.collect_all_feeds()
+        finally:
+            self._write_pool.shutdown(wait=True)
+            self._write_pool = None
         self.save_state()
+        self.save_seen_filter()
 
         duration = time.time() - start_time
         logger.info(f"RSS feed collection finished in {duration:.2f} seconds")